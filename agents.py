@@ -1,4 +1,7 @@
+import io
 import os
+import sys
+from functools import lru_cache
 from crewai import Agent
 from utils.config import Config
 
@@ -11,12 +14,64 @@ except Exception:
     except Exception:
         from langchain.chat_models import ChatOpenAI  # legacy fallback
 
+# Streaming callback support across LangChain versions
+try:
+    from langchain_core.callbacks import BaseCallbackHandler, StreamingStdOutCallbackHandler
+except Exception:
+    try:
+        from langchain.callbacks.base import BaseCallbackHandler
+        from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
+    except Exception:
+        BaseCallbackHandler = object
+        StreamingStdOutCallbackHandler = None
+
+
+class BulletStreamHandler(BaseCallbackHandler):
+    """Flush LLM tokens to stdout and an incremental file as they arrive.
+
+    Attached to the final editing stage so the first bullet appears while
+    upstream agents' output is still being post-processed, instead of only
+    after the whole sequential chain finishes.
+    """
+
+    def __init__(self, path: str = os.path.join("output", "bullets.md")):
+        self.path = path
+        self.buffer = io.StringIO()
+        self._file = None
 
-def make_llm():
+    def on_llm_start(self, *args, **kwargs):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self._file = open(self.path, "w")
+
+    def on_llm_new_token(self, token: str, **kwargs):
+        self.buffer.write(token)
+        sys.stdout.write(token)
+        sys.stdout.flush()
+        if self._file is not None:
+            self._file.write(token)
+            self._file.flush()
+
+    def on_llm_end(self, *args, **kwargs):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@lru_cache(maxsize=1)
+def _default_llm():
+    """Build the shared client once: each ChatOpenAI carries its own HTTP
+    connection pool and tokenizer, so agents reuse a single instance."""
+    callbacks = [StreamingStdOutCallbackHandler()] if StreamingStdOutCallbackHandler is not None else None
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0, streaming=True, callbacks=callbacks)
+
+
+def make_llm(callbacks=None):
     """Create LLM only if OPENAI_API_KEY is present; else raise to allow offline mode."""
     if not os.getenv("OPENAI_API_KEY"):
         raise RuntimeError("OPENAI_API_KEY not set")
-    return ChatOpenAI(model="gpt-4o-mini", temperature=0)
+    if callbacks is None:
+        return _default_llm()
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0, streaming=True, callbacks=callbacks)
 
 
 def make_agents(config: Config = None):
@@ -50,12 +105,14 @@ def make_agents(config: Config = None):
         llm=llm,
     )
 
+    # The editor gets its own streaming LLM so final output is flushed to
+    # disk token-by-token instead of waiting for the whole chain.
     BulletEditor = Agent(
         role="CV Bullet Editor",
         goal=f"Produce polished, grounded sections tailored for a {role}.",
         backstory="Seasoned CV editor for senior ICs and tech leads.",
         allow_delegation=False,
-        llm=llm,
+        llm=make_llm(callbacks=[BulletStreamHandler()]),
     )
 
     return {
@@ -1,16 +1,16 @@
-"""Enhanced prompt templates for better CV bullet point generation."""
+"""Enhanced prompt templates for better CV bullet point generation.
 
-from typing import Dict, Any
-from utils.config import Config
+Each template is split into a byte-stable static prefix (the instruction
+body, with no interpolation) followed by a delimited INPUTS block holding
+every dynamic field. Provider-side prompt caching matches on exact prefixes,
+so keeping the variable data at the tail lets repeated runs reuse the cached
+instruction tokens.
+"""
 
+from typing import Dict, Any, Final
+from utils.config import Config
 
-class PromptTemplates:
-    """Enhanced prompt templates with better context and structure."""
-    
-    @staticmethod
-    def research_prompt(person_name: str, evidence_blob: str) -> str:
-        """Enhanced research prompt with better achievement detection."""
-        return f"""You are an expert software engineering analyst. Your task is to identify significant, measurable achievements from {person_name}'s repository contributions.
+_RESEARCH_PREFIX: Final[str] = """You are an expert software engineering analyst. Your task is to identify significant, measurable achievements from the repository contributions of the person named in the INPUTS block below.
 
 **ANALYSIS GUIDELINES:**
 1. **Focus on Impact**: Look for changes that improved performance, reliability, scalability, or user experience
@@ -36,9 +36,9 @@ class PromptTemplates:
 **OUTPUT FORMAT:**
 Return a JSON with this structure:
 ```json
-{{
+{
   "achievements": [
-    {{
+    {
       "title": "Specific, outcome-focused title",
       "evidence": "Concrete evidence from signals",
       "metric_guess": "Reasonable quantified impact estimate",
@@ -49,23 +49,20 @@ Return a JSON with this structure:
       "commits": ["relevant", "commit", "identifiers"],
       "complexity_score": 1-10,
       "impact_scope": "team/service/organization"
-    }}
+    }
   ]
-}}
+}
 ```
 
-**REPOSITORY SIGNALS:**
-{evidence_blob}
+Analyze the signals in the INPUTS block and identify the most significant achievements attributable to the named person. Focus on quality over quantity.
 
-Analyze these signals and identify the most significant achievements attributable to {person_name}. Focus on quality over quantity."""
+---INPUTS---
+"""
 
-    @staticmethod
-    def attribution_prompt(person_name: str, bullets_count: int) -> str:
-        """Enhanced attribution prompt with confidence scoring."""
-        return f"""You are a senior technical recruiter and engineering manager. Your task is to validate and rank achievements based on authorship evidence and impact.
+_ATTRIBUTION_PREFIX: Final[str] = """You are a senior technical recruiter and engineering manager. Your task is to validate and rank achievements based on authorship evidence and impact, for the person named in the INPUTS block below.
 
 **VALIDATION CRITERIA:**
-1. **Authorship Confidence**: How certain are we that {person_name} was the primary contributor?
+1. **Authorship Confidence**: How certain are we that the named person was the primary contributor?
    - High: Clear commit authorship, PR ownership, or explicit assignments
    - Medium: Significant contributions but shared ownership
    - Low: Minor contributions or unclear attribution
@@ -87,31 +84,31 @@ Analyze these signals and identify the most significant achievements attributabl
 - Remove achievements lacking concrete evidence
 
 **OUTPUT REQUIREMENTS:**
-Return exactly {bullets_count} validated achievements in JSON format:
+Return exactly BULLETS_COUNT validated achievements in JSON format:
 ```json
-{{
+{
   "validated_achievements": [
-    {{
+    {
       "title": "Clear, outcome-focused title",
       "impact": "Quantified business/technical impact",
       "metrics": "Specific, realistic measurements",
       "confidence": "High/Medium/Low",
       "proof_snippets": ["concrete", "evidence", "quotes"],
       "ranking_score": 1-100
-    }}
+    }
   ]
-}}
+}
 ```
 
-Reject any achievement where {person_name}'s contribution cannot be clearly established or where metrics appear fabricated."""
+Reject any achievement where the named person's contribution cannot be clearly established or where metrics appear fabricated.
 
-    @staticmethod
-    def synthesis_prompt(bullets_count: int) -> str:
-        """Enhanced synthesis prompt for better section generation."""
-        return f"""You are a senior CV editor specializing in technical leadership resumes. Transform validated achievements into compelling, structured sections.
+---INPUTS---
+"""
+
+_SYNTHESIS_PREFIX: Final[str] = """You are a senior CV editor specializing in technical leadership resumes. Transform validated achievements into compelling, structured sections.
 
 **SECTION REQUIREMENTS:**
-Create exactly {bullets_count} sections following this EXACT template:
+Create exactly BULLETS_COUNT sections (the count is given in the INPUTS block below) following this EXACT template:
 
 ```
 ## <Outcome-Focused Title>
@@ -122,7 +119,7 @@ Create exactly {bullets_count} sections following this EXACT template:
 **WRITING GUIDELINES:**
 1. **Titles**: Start with action verbs (Architected, Optimized, Implemented, Led, Designed)
 2. **Bullet Points**: Lead with the outcome, include key metrics, avoid technical jargon
-3. **Descriptions**: 
+3. **Descriptions**:
    - Explain the technical challenge and solution approach
    - Reference specific technologies, patterns, or methodologies
    - Include concrete metrics and timeframes
@@ -148,57 +145,81 @@ Create exactly {bullets_count} sections following this EXACT template:
 - No passive voice ("was implemented" → "implemented")
 - No vague terms ("helped", "assisted", "worked on")
 
-Transform the validated achievements into polished sections that demonstrate technical leadership and measurable impact."""
+Transform the validated achievements into polished sections that demonstrate technical leadership and measurable impact.
 
-    @staticmethod
-    def editing_prompt(style: str) -> str:
-        """Enhanced editing prompt with style-specific guidance."""
-        style_guides = {
-            "senior_technical_lead": """
+---INPUTS---
+"""
+
+_EDITING_PREFIX: Final[str] = """You are a professional CV editor. Polish the provided sections to meet high professional standards, following the style guide in the INPUTS block below.
+
+**EDITING CHECKLIST:**
+□ Each section follows the exact template format
+□ Titles are outcome-focused and start with strong action verbs
+□ Bullet points are single, powerful sentences ending with <br />
+□ Descriptions provide technical context and measurable impact
+□ All metrics are realistic and specific
+□ Language is active, confident, and professional
+□ No hyperlinks, lists, or formatting issues remain
+□ Consistent terminology and style throughout
+
+**FINAL OUTPUT:**
+Return only the polished Markdown sections with NO additional commentary or explanation.
+
+---INPUTS---
+"""
+
+_STYLE_GUIDES: Final[Dict[str, str]] = {
+    "senior_technical_lead": """
 **SENIOR TECHNICAL LEAD STYLE:**
 - Emphasize architectural decisions and system-level thinking
-- Include 2-3 sections on scalability/reliability improvements  
+- Include 2-3 sections on scalability/reliability improvements
 - Include 1 section on team leadership or mentoring
 - Show progression from individual contributor to technical leader
 - Balance hands-on technical work with strategic thinking
 - Metrics should reflect organization-level impact
             """,
-            "simple": """
+    "simple": """
 **SIMPLE STYLE:**
 - Keep descriptions concise (2-3 sentences max)
 - Focus on the most impactful metrics
 - Use straightforward language
 - Emphasize concrete deliverables
-            """
-        }
-        
-        guide = style_guides.get(style, style_guides["senior_technical_lead"])
-        
-        return f"""You are a professional CV editor. Polish the provided sections to meet high professional standards.
+            """,
+}
 
-{guide}
 
-**EDITING CHECKLIST:**
-□ Each section follows the exact template format
-□ Titles are outcome-focused and start with strong action verbs
-□ Bullet points are single, powerful sentences ending with <br />
-□ Descriptions provide technical context and measurable impact
-□ All metrics are realistic and specific
-□ Language is active, confident, and professional
-□ No hyperlinks, lists, or formatting issues remain
-□ Consistent terminology and style throughout
+class PromptTemplates:
+    """Enhanced prompt templates with better context and structure."""
 
-**FINAL OUTPUT:**
-Return only the polished Markdown sections with NO additional commentary or explanation."""
+    @staticmethod
+    def research_prompt(person_name: str, evidence_blob: str) -> str:
+        """Enhanced research prompt with better achievement detection."""
+        return f"{_RESEARCH_PREFIX}person_name: {person_name}\nsignals:\n{evidence_blob}"
+
+    @staticmethod
+    def attribution_prompt(person_name: str, bullets_count: int) -> str:
+        """Enhanced attribution prompt with confidence scoring."""
+        return f"{_ATTRIBUTION_PREFIX}person_name: {person_name}\nBULLETS_COUNT={bullets_count}"
+
+    @staticmethod
+    def synthesis_prompt(bullets_count: int) -> str:
+        """Enhanced synthesis prompt for better section generation."""
+        return f"{_SYNTHESIS_PREFIX}BULLETS_COUNT={bullets_count}"
+
+    @staticmethod
+    def editing_prompt(style: str) -> str:
+        """Enhanced editing prompt with style-specific guidance."""
+        guide = _STYLE_GUIDES.get(style, _STYLE_GUIDES["senior_technical_lead"])
+        return f"{_EDITING_PREFIX}{guide.strip()}"
 
 
 def get_enhanced_prompts(config: Config) -> Dict[str, str]:
     """Get all enhanced prompts configured for the specific user."""
     templates = PromptTemplates()
-    
+
     return {
         "research_template": templates.research_prompt,
-        "attribution_template": templates.attribution_prompt, 
+        "attribution_template": templates.attribution_prompt,
         "synthesis_template": templates.synthesis_prompt,
         "editing_template": templates.editing_prompt
-    }
\ No newline at end of file
+    }
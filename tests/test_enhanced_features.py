@@ -1,8 +1,6 @@
 """Tests for enhanced features."""
 import os
 import sys
-import tempfile
-import yaml
 from unittest.mock import patch, MagicMock
 
 # Ensure project root is on path
@@ -15,42 +13,47 @@ from analyzers.signal_analyzer import EnhancedSignalAnalyzer
 import pytest
 
 
-def test_config_validation():
+# Session-scoped config fixtures: one temp file and one YAML parse for the
+# whole run instead of a NamedTemporaryFile create/flush/unlink per test.
+# Literal YAML because the schema is tiny and fixed.
+@pytest.fixture(scope="session")
+def valid_config_path(tmp_path_factory):
+    p = tmp_path_factory.mktemp("cfg") / "valid.yaml"
+    p.write_text(
+        "you:\n"
+        "  full_name: Test User\n"
+        "  aliases: [Test User]\n"
+        "  emails: [test@example.com]\n"
+        "git: {since: '2023-01-01', until: '2023-12-31'}\n"
+        "analysis: {max_files: 1000, hot_file_top_n: 10, languages_of_interest: [py, js]}\n"
+        "output: {bullets_count: 5}\n"
+    )
+    return str(p)
+
+
+@pytest.fixture(scope="session")
+def invalid_config_path(tmp_path_factory):
+    p = tmp_path_factory.mktemp("cfg") / "invalid.yaml"
+    p.write_text(
+        "you: {full_name: Test User}\n"  # Missing emails
+        "git: {}\n"
+        "analysis: {}\n"
+        "output: {}\n"
+    )
+    return str(p)
+
+
+def test_config_validation(valid_config_path):
     """Test configuration validation."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump({
-            'you': {
-                'full_name': 'Test User',
-                'emails': ['test@example.com']
-            },
-            'git': {'since': '2023-01-01'},
-            'analysis': {'max_files': 1000},
-            'output': {'bullets_count': 5}
-        }, f)
-        f.flush()
-        
-        config = Config(f.name)
-        assert config.person_name == 'Test User'
-        assert config.bullets_count == 5
-        
-        os.unlink(f.name)
-
-
-def test_config_validation_missing_fields():
+    config = Config(valid_config_path)
+    assert config.person_name == 'Test User'
+    assert config.bullets_count == 5
+
+
+def test_config_validation_missing_fields(invalid_config_path):
     """Test configuration validation with missing fields."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump({
-            'you': {'full_name': 'Test User'},  # Missing emails
-            'git': {},
-            'analysis': {},
-            'output': {}
-        }, f)
-        f.flush()
-        
-        with pytest.raises(ConfigError, match="emails.*must be a non-empty list"):
-            Config(f.name)
-        
-        os.unlink(f.name)
+    with pytest.raises(ConfigError, match="emails.*must be a non-empty list"):
+        Config(invalid_config_path)
 
 
 def test_progress_tracker():
@@ -108,7 +111,8 @@ def test_enhanced_formatter_low_quality():
 @patch('analyzers.signal_analyzer.load_git_history')
 @patch('analyzers.signal_analyzer.walk_code')
 @patch('analyzers.signal_analyzer.load_github_issues_prs')
-def test_signal_analyzer_integration(mock_github, mock_walk, mock_git):
+@patch('analyzers.signal_analyzer.have_async_support', return_value=False)
+def test_signal_analyzer_integration(mock_async, mock_github, mock_walk, mock_git, valid_config_path):
     """Test enhanced signal analyzer integration."""
     # Mock dependencies
     mock_git.return_value = [
@@ -127,35 +131,19 @@ def test_signal_analyzer_integration(mock_github, mock_walk, mock_git):
     mock_walk.return_value = ['file1.py', 'file2.js']
     mock_github.return_value = {'issues': [], 'prs': []}
     
-    # Create config
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump({
-            'you': {
-                'full_name': 'Test User',
-                'aliases': ['Test User'],
-                'emails': ['test@example.com']
-            },
-            'git': {'since': '2023-01-01', 'until': '2023-12-31'},
-            'analysis': {'max_files': 1000, 'hot_file_top_n': 10, 'languages_of_interest': ['py', 'js']},
-            'output': {'bullets_count': 5}
-        }, f)
-        f.flush()
-        
-        config = Config(f.name)
-        progress = ProgressTracker(verbose=False)
-        
-        analyzer = EnhancedSignalAnalyzer(config, progress)
-        
-        # Mock the file operations
-        with patch('builtins.open'), patch('json.dump'), patch('os.makedirs'):
-            signals = analyzer.collect_enhanced_signals()
-        
-        assert 'commits_you' in signals
-        assert 'summary_you' in signals
-        assert 'commit_patterns' in signals
-        assert 'impact_signals' in signals
-        
-        os.unlink(f.name)
+    config = Config(valid_config_path)
+    progress = ProgressTracker(verbose=False)
+
+    analyzer = EnhancedSignalAnalyzer(config, progress)
+
+    # Mock the file operations
+    with patch('builtins.open'), patch('json.dump'), patch('os.makedirs'):
+        signals = analyzer.collect_enhanced_signals()
+
+    assert 'commits_you' in signals
+    assert 'summary_you' in signals
+    assert 'commit_patterns' in signals
+    assert 'impact_signals' in signals
 
 
 def test_section_extraction():
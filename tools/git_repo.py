@@ -1,10 +1,50 @@
 from git import Repo
+from git.exc import InvalidGitRepositoryError, NoSuchPathError
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from functools import lru_cache
+from itertools import chain
 import os
 import re
 
-def load_git_history(repo_path, since=None, until=None, include_merges=False):
+# numpy turns the column aggregations into single C calls; pure-Python
+# parallel lists remain a correct fallback
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+_EMPTY_STATS = (0, 0, [])
+
+
+def _batch_numstat(repo, rev, kwargs):
+    """Collect (insertions, deletions, files) per SHA in one git invocation.
+
+    GitPython's Commit.stats shells out per commit, which dominates history
+    loading on mid-size repos. A single `git log --numstat` emits every
+    commit's diffstat in one subprocess; the output is parsed linearly into
+    a dict keyed by SHA.
+    """
+    out = repo.git.log("--numstat", "--format=__COMMIT__%H", rev, **kwargs)
+    stats = {}
+    cur = None
+    for line in out.splitlines():
+        if line.startswith("__COMMIT__"):
+            cur = [0, 0, []]
+            stats[line[10:]] = cur
+        elif line and cur is not None:
+            ins, _, rest = line.partition("\t")
+            dels, _, path = rest.partition("\t")
+            # Binary files report "-" for both counts
+            if ins.isdigit():
+                cur[0] += int(ins)
+            if dels.isdigit():
+                cur[1] += int(dels)
+            cur[2].append(path)
+    return stats
+
+
+def load_git_history(repo_path, since=None, until=None, include_merges=False, want_stats=True):
     repo = Repo(repo_path)
     assert not repo.bare, "Repo is bare"
     rev = "HEAD"
@@ -13,39 +53,71 @@ def load_git_history(repo_path, since=None, until=None, include_merges=False):
     if until: kwargs["until"] = until
     if not include_merges: kwargs["no_merges"] = True
 
-    commits = list(repo.iter_commits(rev, **kwargs))
-    out = []
-    for c in commits:
-        out.append({
+    # One batched numstat pass replaces the per-commit c.stats subprocesses;
+    # callers that only need metadata can skip diffstats entirely
+    stats = _batch_numstat(repo, rev, kwargs) if want_stats else {}
+    commits = []
+    for c in repo.iter_commits(rev, **kwargs):
+        ins, dels, files = stats.get(c.hexsha, _EMPTY_STATS)
+        commits.append({
             "hexsha": c.hexsha,
             "author_name": c.author.name,
             "author_email": c.author.email,
             "authored_datetime": c.authored_datetime.isoformat(),
             "message": c.message.strip(),
-            # c.stats.files is a dict keyed by file path strings
-            "files": list(c.stats.files.keys()),
-            "insertions": c.stats.total["insertions"],
-            "deletions": c.stats.total["deletions"]
+            "files": files,
+            "insertions": ins,
+            "deletions": dels
         })
-    return out
+    return commits
 
 def contributions_by_user(commits, aliases, emails):
-    def is_you(a_name, a_email):
-        return (a_name in aliases) or (a_email in emails)
-    yours = [c for c in commits if is_you(c["author_name"], c["author_email"])]
-    others = [c for c in commits if c not in yours]
+    # Single streaming partition: the old `c not in yours` membership test
+    # re-scanned the yours list per commit (quadratic with dict equality)
+    aliases = frozenset(aliases)
+    emails = frozenset(emails)
+    yours = []
+    others = []
+    for c in commits:
+        if c["author_name"] in aliases or c["author_email"] in emails:
+            yours.append(c)
+        else:
+            others.append(c)
     return yours, others
 
+def commits_to_columns(commits):
+    """Transpose the list-of-dicts history into parallel columns (SoA).
+
+    Aggregations over one field then touch a contiguous array instead of
+    hashing the same dict key per commit; the count columns are numpy
+    arrays when available so sums run as single C reductions.
+    """
+    n = len(commits)
+    if np is not None:
+        ins = np.fromiter((c["insertions"] for c in commits), dtype=np.int64, count=n)
+        dels = np.fromiter((c["deletions"] for c in commits), dtype=np.int64, count=n)
+    else:
+        ins = [c["insertions"] for c in commits]
+        dels = [c["deletions"] for c in commits]
+    return {
+        "hexsha": [c["hexsha"] for c in commits],
+        "insertions": ins,
+        "deletions": dels,
+        "files": [c["files"] for c in commits],
+    }
+
+
 def summarize_impact(commits):
-    total_insert = sum(c["insertions"] for c in commits)
-    total_delete = sum(c["deletions"] for c in commits)
-    total_commits = len(commits)
-    files_touched = set()
-    for c in commits:
-        for f in c["files"]:
-            files_touched.add(f)
+    # Accepts either the AoS commit list or a commits_to_columns() dict
+    cols = commits if isinstance(commits, dict) else commits_to_columns(commits)
+    ins, dels, files_col = cols["insertions"], cols["deletions"], cols["files"]
+    if np is not None:
+        total_insert, total_delete = int(ins.sum()), int(dels.sum())
+    else:
+        total_insert, total_delete = sum(ins), sum(dels)
+    files_touched = set(chain.from_iterable(files_col))
     return {
-        "total_commits": total_commits,
+        "total_commits": len(files_col),
         "total_insertions": total_insert,
         "total_deletions": total_delete,
         "files_touched_count": len(files_touched),
@@ -53,44 +125,45 @@ def summarize_impact(commits):
     }
 
 def hot_files(commits, top_n=50):
-    freq = defaultdict(int)
-    for c in commits:
-        for f in c["files"]:
-            freq[f] += 1
-    ranked = sorted(freq.items(), key=lambda x: x[1], reverse=True)
-    return ranked[:top_n]
+    # Counter.update consumes the flattened file stream in C, and
+    # most_common heap-selects top_n instead of sorting every entry
+    freq = Counter()
+    freq.update(chain.from_iterable(c["files"] for c in commits))
+    return freq.most_common(top_n)
+
+# SSH (git@github.com:owner/repo.git) and HTTPS
+# (https://github.com/owner/repo[.git][/]) in one anchored alternation;
+# the optional .git is consumed here so no trailing sub is needed
+_REMOTE_RE = re.compile(
+    r"^(?:git@github\.com:|https?://github\.com/)"
+    r"(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$"
+)
+
 
 def get_github_owner_repo(repo_path: str):
     """Attempt to derive GitHub owner/repo from the git remote URL.
 
-    Supports SSH and HTTPS remotes, e.g.:
-    - git@github.com:owner/repo.git
-    - https://github.com/owner/repo.git
-    - https://github.com/owner/repo
     Returns (owner, repo) or (None, None) if not found/parsable.
+    Results are cached per absolute path since opening the repo and reading
+    its remote config repeats identically within a process.
     """
+    return _get_github_owner_repo_cached(os.path.abspath(repo_path))
+
+
+@lru_cache(maxsize=32)
+def _get_github_owner_repo_cached(repo_path: str):
     try:
         repo = Repo(repo_path)
-        url = None
-        try:
-            url = next(repo.remote("origin").urls)
-        except Exception:
-            # No origin remote
-            return None, None
-        if not url:
-            return None, None
-        # Normalize
-        # SSH: git@github.com:owner/repo.git
-        m = re.match(r"git@github\.com:(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?$", url)
-        if not m:
-            # HTTPS: https://github.com/owner/repo(.git)?
-            m = re.match(r"https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?(?:/)?$", url)
-        if m:
-            owner = m.group("owner")
-            repo_name = m.group("repo")
-            # Strip .git if still present
-            repo_name = re.sub(r"\.git$", "", repo_name)
-            return owner, repo_name
+    except (InvalidGitRepositoryError, NoSuchPathError):
         return None, None
+    try:
+        url = next(repo.remote("origin").urls)
     except Exception:
+        # No origin remote
+        return None, None
+    if not url:
         return None, None
+    m = _REMOTE_RE.match(url)
+    if m:
+        return m.group("owner"), m.group("repo")
+    return None, None
@@ -1,6 +1,88 @@
 import os
+from collections import defaultdict
+
+import requests
 from github import Github
 
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# One GraphQL query asks for exactly the PR fields the analyzer consumes,
+# instead of REST paging plus a detail request per PR for additions/deletions.
+_PR_QUERY = """
+query($o: String!, $r: String!, $c: String) {
+  repository(owner: $o, name: $r) {
+    pullRequests(first: 100, after: $c, orderBy: {field: CREATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        number title state merged additions deletions changedFiles
+        createdAt closedAt
+        author { login }
+      }
+    }
+  }
+}
+"""
+
+
+def load_github_prs_graphql(owner, repo, token):
+    """Fetch all PRs via paginated GraphQL, normalized to the REST dict shape."""
+    prs = []
+    cursor = None
+    while True:
+        resp = requests.post(
+            GRAPHQL_URL,
+            json={"query": _PR_QUERY, "variables": {"o": owner, "r": repo, "c": cursor}},
+            headers={"Authorization": f"bearer {token}"},
+            timeout=30,
+        )
+        resp.raise_for_status()
+        payload = resp.json()
+        if payload.get("errors"):
+            raise RuntimeError(str(payload["errors"]))
+        page = payload["data"]["repository"]["pullRequests"]
+
+        for n in page["nodes"]:
+            prs.append({
+                "number": n["number"], "title": n["title"], "state": (n["state"] or "").lower(),
+                "user": (n.get("author") or {}).get("login"),
+                "created_at": n.get("createdAt"), "closed_at": n.get("closedAt"),
+                "merged": n["merged"],
+                "additions": n["additions"], "deletions": n["deletions"],
+                "changed_files": n["changedFiles"],
+                "labels": [], "assignees": [],
+                "comments_count": 0, "comments_sample": []
+            })
+
+        if not page["pageInfo"]["hasNextPage"]:
+            return prs
+        cursor = page["pageInfo"]["endCursor"]
+
+
+def _bulk_comment_bodies(owner, repo, token):
+    """Fetch every issue and review comment repo-wide, grouped by number.
+
+    Calling p.get_comments() + p.get_review_comments() per PR is an N+1
+    network pattern; the repository-level comments endpoints return the
+    same bodies in O(total comments / 100) pages regardless of PR count.
+    """
+    grouped = defaultdict(list)
+    headers = {"Authorization": f"token {token}"}
+    for endpoint in ("issues/comments", "pulls/comments"):
+        url = f"https://api.github.com/repos/{owner}/{repo}/{endpoint}"
+        params = {"per_page": 100}
+        while url:
+            resp = requests.get(url, params=params, headers=headers, timeout=30)
+            resp.raise_for_status()
+            for c in resp.json():
+                ref = c.get("issue_url") or c.get("pull_request_url") or ""
+                num = ref.rpartition("/")[2]
+                if num.isdigit():
+                    grouped[int(num)].append(c.get("body") or "")
+            url = resp.links.get("next", {}).get("url")
+            params = None  # the Link header already carries the query string
+    return grouped
+
+
 def load_github_issues_prs(owner, repo):
     token = os.getenv("GITHUB_TOKEN")
     # Require token and valid owner/repo; otherwise skip network
@@ -25,20 +107,30 @@ def load_github_issues_prs(owner, repo):
                 "body": (i.body or "")[:4000]
             })
 
-        for p in r.get_pulls(state="all"):
-            comments = list(p.get_comments()) + list(p.get_review_comments())
-            prs.append({
-                "number": p.number, "title": p.title, "state": p.state,
-                "user": p.user.login if p.user else None,
-                "created_at": p.created_at.isoformat() if p.created_at else None,
-                "closed_at": p.closed_at.isoformat() if p.closed_at else None,
-                "merged": p.is_merged(),
-                "additions": p.additions, "deletions": p.deletions, "changed_files": p.changed_files,
-                "labels": [l.name for l in p.get_labels()],
-                "assignees": [a.login for a in p.assignees],
-                "comments_count": len(comments),
-                "comments_sample": [c.body[:1000] for c in comments[:10]]
-            })
+        # Prefer the single GraphQL query for PRs; it cuts request count and
+        # payload size versus REST paging plus a detail call per PR.
+        try:
+            prs = load_github_prs_graphql(owner, repo, token)
+        except Exception:
+            # Two repo-wide comment fetches replace the per-PR round-trips
+            try:
+                comment_bodies = _bulk_comment_bodies(owner, repo, token)
+            except Exception:
+                comment_bodies = {}
+            for p in r.get_pulls(state="all"):
+                comments = comment_bodies.get(p.number, [])
+                prs.append({
+                    "number": p.number, "title": p.title, "state": p.state,
+                    "user": p.user.login if p.user else None,
+                    "created_at": p.created_at.isoformat() if p.created_at else None,
+                    "closed_at": p.closed_at.isoformat() if p.closed_at else None,
+                    "merged": p.is_merged(),
+                    "additions": p.additions, "deletions": p.deletions, "changed_files": p.changed_files,
+                    "labels": [l.name for l in p.get_labels()],
+                    "assignees": [a.login for a in p.assignees],
+                    "comments_count": len(comments),
+                    "comments_sample": [c[:1000] for c in comments[:10]]
+                })
         return {"issues": issues, "prs": prs}
     except Exception:
         # Network errors or API issues: degrade gracefully
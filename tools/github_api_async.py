@@ -0,0 +1,173 @@
+"""Concurrent GitHub REST fetching with aiohttp.
+
+The sync loader in github_api.py walks issues and PRs one page (and one PR
+detail) at a time, so wall-clock time is dominated by sequential HTTP round
+trips. Here the first response's Link header tells us the page count and the
+remaining pages are fetched with asyncio.gather, bounded by a semaphore to
+stay inside GitHub's rate limits.
+"""
+import asyncio
+import json
+import os
+import re
+
+# aiohttp is optional; callers fall back to the sync loader when missing
+try:
+    import aiohttp
+except Exception:
+    aiohttp = None
+
+API_BASE = "https://api.github.com"
+PER_PAGE = 100
+MAX_CONCURRENT_REQUESTS = 10
+
+_LAST_PAGE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# ETag cache: unchanged pages answer 304 with zero body bytes, so re-runs on
+# a quiet repo cost one header round-trip per endpoint instead of full pages
+_ETAG_CACHE_PATH = os.path.join("output", ".github_cache", "etags.json")
+
+
+def _load_etag_cache() -> dict:
+    try:
+        with open(_ETAG_CACHE_PATH, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _save_etag_cache(cache: dict) -> None:
+    try:
+        os.makedirs(os.path.dirname(_ETAG_CACHE_PATH), exist_ok=True)
+        with open(_ETAG_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except Exception:
+        pass  # Caching is best-effort; never fail the fetch
+
+
+def have_async_support() -> bool:
+    """Whether the aiohttp-backed loader can be used."""
+    return aiohttp is not None
+
+
+def _last_page_from_link(link_header: str) -> int:
+    if not link_header:
+        return 1
+    m = _LAST_PAGE.search(link_header)
+    return int(m.group(1)) if m else 1
+
+
+async def _get_json(session, sem, url, params=None, etag_cache=None):
+    key = url
+    if params:
+        key += "|" + "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+    entry = etag_cache.get(key) if etag_cache is not None else None
+
+    headers = {"If-None-Match": entry["etag"]} if entry else {}
+    async with sem:
+        async with session.get(url, params=params, headers=headers) as resp:
+            if resp.status == 304 and entry is not None:
+                # Unchanged since last run: reuse the cached body (and the
+                # cached Link header, which 304 responses may omit)
+                return entry["body"], {"Link": entry.get("link", "")}
+            resp.raise_for_status()
+            body = await resp.json()
+            etag = resp.headers.get("ETag")
+            if etag_cache is not None and etag:
+                etag_cache[key] = {
+                    "etag": etag, "body": body,
+                    "link": resp.headers.get("Link", ""),
+                }
+            return body, resp.headers
+
+
+async def _fetch_paginated(session, sem, url, etag_cache=None):
+    """Fetch every page of a list endpoint, pages 2..N concurrently."""
+    first, headers = await _get_json(
+        session, sem, url, params={"per_page": PER_PAGE, "page": 1}, etag_cache=etag_cache
+    )
+    last_page = _last_page_from_link(headers.get("Link", ""))
+
+    if last_page <= 1:
+        return first
+
+    rest = await asyncio.gather(*[
+        _get_json(session, sem, url, params={"per_page": PER_PAGE, "page": p}, etag_cache=etag_cache)
+        for p in range(2, last_page + 1)
+    ])
+    items = list(first)
+    for page_items, _ in rest:
+        items.extend(page_items)
+    return items
+
+
+async def _fetch_all(owner, repo, token):
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    headers = {
+        "Authorization": f"token {token}",
+        "Accept": "application/vnd.github+json",
+    }
+
+    etag_cache = _load_etag_cache()
+    async with aiohttp.ClientSession(headers=headers) as session:
+        raw_issues, raw_prs = await asyncio.gather(
+            _fetch_paginated(session, sem, f"{API_BASE}/repos/{owner}/{repo}/issues?state=all", etag_cache),
+            _fetch_paginated(session, sem, f"{API_BASE}/repos/{owner}/{repo}/pulls?state=all", etag_cache),
+        )
+
+        # The pulls list endpoint omits additions/deletions; fetch details
+        # for every PR concurrently instead of one blocking GET each.
+        details = await asyncio.gather(*[
+            _get_json(session, sem, f"{API_BASE}/repos/{owner}/{repo}/pulls/{p['number']}",
+                      etag_cache=etag_cache)
+            for p in raw_prs
+        ], return_exceptions=True)
+    _save_etag_cache(etag_cache)
+
+    issues = []
+    for i in raw_issues:
+        issues.append({
+            "id": i.get("id"), "number": i.get("number"), "title": i.get("title"),
+            "state": i.get("state"),
+            "user": (i.get("user") or {}).get("login"),
+            "created_at": i.get("created_at"), "closed_at": i.get("closed_at"),
+            "comments": i.get("comments", 0),
+            "labels": [l.get("name") for l in i.get("labels", [])],
+            "assignees": [a.get("login") for a in i.get("assignees", [])],
+            "is_pr": i.get("pull_request") is not None,
+            "body": (i.get("body") or "")[:4000]
+        })
+
+    prs = []
+    for p, detail in zip(raw_prs, details):
+        d = detail[0] if not isinstance(detail, Exception) else {}
+        prs.append({
+            "number": p.get("number"), "title": p.get("title"), "state": p.get("state"),
+            "user": (p.get("user") or {}).get("login"),
+            "created_at": p.get("created_at"), "closed_at": p.get("closed_at"),
+            "merged": bool(d.get("merged", p.get("merged_at") is not None)),
+            "additions": d.get("additions", 0), "deletions": d.get("deletions", 0),
+            "changed_files": d.get("changed_files", 0),
+            "labels": [l.get("name") for l in p.get("labels", [])],
+            "assignees": [a.get("login") for a in p.get("assignees", [])],
+            "comments_count": d.get("comments", 0) + d.get("review_comments", 0),
+            "comments_sample": []
+        })
+
+    return {"issues": issues, "prs": prs}
+
+
+def load_github_issues_prs_async(owner, repo):
+    """Drop-in replacement for load_github_issues_prs with concurrent paging."""
+    token = os.getenv("GITHUB_TOKEN")
+    # Require token and valid owner/repo; otherwise skip network
+    if not token or not owner or not repo or owner == "your-org-or-username" or repo == "your-repo-name":
+        return {"issues": [], "prs": []}
+    if aiohttp is None:
+        raise RuntimeError("aiohttp is not installed")
+
+    try:
+        return asyncio.run(_fetch_all(owner, repo, token))
+    except Exception:
+        # Network errors or API issues: degrade gracefully
+        return {"issues": [], "prs": []}
@@ -0,0 +1,118 @@
+"""Shared output pipeline helpers.
+
+One canonical implementation of the offline-summary builder and the output
+writer, typed precisely so the hot path stays in a single compiled/specialized
+code object (and remains a candidate for mypyc/Cython later).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+OFFLINE_PREFIX = (
+    "[Enhanced Offline Mode] Could not run full CrewAI pipeline. "
+    "Generated an enhanced summary from local signals instead.\n\n"
+)
+
+
+def build_fallback_sections(signals: dict[str, Any], person_name: str) -> list[tuple[str, str, str]]:
+    """Derive (title, bullet point, description) sections from local signals."""
+    summary = signals.get("summary_you", {})
+    patterns = signals.get("commit_patterns", [])
+    impact_signals = signals.get("impact_signals", [])
+
+    # Cold-signal case (brand-new repo): skip the three section builders
+    if not (summary or patterns or impact_signals):
+        return [("Limited Signal Analysis",
+                 "Analysis completed with available local signals.",
+                 "Enhanced offline mode provided basic contribution analysis from repository data.")]
+
+    sections: list[tuple[str, str, str]] = []
+
+    # Enhanced contribution summary
+    if summary:
+        title = "Technical Leadership Impact"
+        commits = summary.get('total_commits', 0)
+        files = summary.get('files_touched_count', 0)
+        net_lines = summary.get('net_lines', 0)
+        directories = summary.get('directories_touched_count', 0)
+
+        bp = (
+            f"{person_name} delivered {commits} commits across {files} files "
+            f"in {directories} directories (+{summary.get('total_insertions', 0)}/-{summary.get('total_deletions', 0)} LOC), "
+            f"demonstrating sustained technical leadership and architectural ownership."
+        )
+        desc = (
+            f"Contributions demonstrate systematic approach to software delivery with {summary.get('avg_commits_per_week', 0)} commits per week on average. "
+            f"The breadth across {directories} directories and {net_lines:+} net lines of code indicates "
+            f"significant architectural involvement and feature development leadership. "
+            f"Largest single contribution involved {summary.get('largest_single_commit', 0)} lines, suggesting complex feature implementations."
+        )
+        sections.append((title, bp, desc))
+
+    # Pattern-based achievements
+    if patterns:
+        top_pattern = patterns[0]
+        title = f"{top_pattern.get('theme', 'Technical').title()} Initiative Leadership"
+        bp = (
+            f"Led {top_pattern.get('theme', 'technical').lower()} initiative spanning "
+            f"{top_pattern.get('commit_count', 0)} commits and {len(top_pattern.get('files_affected', []))} files, "
+            f"achieving complexity score of {top_pattern.get('complexity_score', 0)}."
+        )
+        desc = (
+            f"Systematic approach to {top_pattern.get('theme', 'technical').lower()} improvements demonstrated through "
+            f"coordinated changes across {len(top_pattern.get('files_affected', []))} files. "
+            f"The {top_pattern.get('total_changes', 0)} total line changes reflect comprehensive refactoring "
+            f"and architectural enhancement efforts with measurable complexity impact."
+        )
+        sections.append((title, bp, desc))
+
+    # Impact signals summary
+    if impact_signals:
+        # Only the first high-impact signal is used; stop at the first match
+        # instead of materializing the full filtered list
+        signal = next((s for s in impact_signals if s.get('estimated_impact') == 'High'), None)
+        if signal is not None:
+            title = f"{signal.get('type', 'Technical').title()} Optimization Delivery"
+            bp = (
+                f"Delivered {signal.get('type', 'technical')} improvements across "
+                f"{signal.get('files_count', 0)} files with {signal.get('confidence', 0):.0%} confidence, "
+                f"achieving {signal.get('estimated_impact', 'significant').lower()} impact."
+            )
+            hints = signal.get('metrics_hints', [])
+            metrics_text = " ".join(hints[:2]) if hints else "measurable performance improvements"
+            desc = (
+                f"Technical leadership in {signal.get('type', 'system')} optimization resulted in {metrics_text}. "
+                f"Evidence from commit patterns shows systematic approach to improvement with "
+                f"focus on {signal.get('files_count', 0)} critical system components."
+            )
+            sections.append((title, bp, desc))
+
+    if not sections:
+        sections = [("Limited Signal Analysis",
+                   "Analysis completed with available local signals.",
+                   "Enhanced offline mode provided basic contribution analysis from repository data.")]
+
+    return sections
+
+
+def build_fallback(signals: dict[str, Any], person_name: str) -> str:
+    """Build the full offline summary text from local signals."""
+    # Accumulate chunks and join once; repeated str += reallocates
+    parts = [OFFLINE_PREFIX]
+    for title, bp, desc in build_fallback_sections(signals, person_name):
+        parts.append(f"\n\n## {title}\n\n**Bullet Point:** {bp} <br />\n\n**Description:** {desc}")
+    return "".join(parts)
+
+
+def write_output(header: str, output_text: str, output_file: str | Path) -> Path:
+    """Write the final document in buffered pieces and return its path."""
+    path = Path(output_file)
+    # Write the pieces straight to a generously buffered file instead of
+    # concatenating one large temporary string first
+    with open(path, "w", buffering=65536) as f:
+        f.write(header)
+        if output_text:
+            f.write(output_text)
+        f.write("\n")
+    return path
@@ -0,0 +1,110 @@
+"""Semantic cache over full pipeline outputs.
+
+Re-runs across commits that barely change the signal set produce
+near-identical LLM output, so the evidence is embedded with a small local
+model and looked up against previous runs; a close-enough neighbour
+short-circuits the multi-second CrewAI round-trips entirely.
+
+The cache degrades to a no-op when sentence-transformers is not installed,
+mirroring the optional-dependency handling elsewhere in this package.
+"""
+import json
+import os
+import pickle
+
+try:
+    from sentence_transformers import SentenceTransformer
+except Exception:
+    SentenceTransformer = None
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+_CACHE_PATH = os.path.join("output", ".sem_cache", "entries.pkl")
+_MAX_ENTRIES = 256
+# Cosine distance below which a previous output is considered equivalent
+_DISTANCE_THRESHOLD = 0.05
+
+_model = None
+
+
+def have_semantic_cache() -> bool:
+    """Whether the embedding model dependency is available."""
+    return SentenceTransformer is not None
+
+
+def _get_model():
+    global _model
+    if _model is None:
+        _model = SentenceTransformer("BAAI/bge-small-en-v1.5")
+    return _model
+
+
+def _embed(signals) -> list:
+    text = json.dumps(signals, sort_keys=True, default=str)
+    vec = _get_model().encode([text], normalize_embeddings=True)[0]
+    return [float(x) for x in vec]
+
+
+def _load_entries() -> list:
+    try:
+        with open(_CACHE_PATH, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return []
+
+
+def _save_entries(entries) -> None:
+    try:
+        os.makedirs(os.path.dirname(_CACHE_PATH), exist_ok=True)
+        with open(_CACHE_PATH, "wb") as f:
+            pickle.dump(entries, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass  # Caching is best-effort; never fail the pipeline
+
+
+def semantic_lookup(signals, config_key: str):
+    """Return a cached output for semantically equivalent signals, or None."""
+    if not have_semantic_cache():
+        return None
+    try:
+        vec = _embed(signals)
+    except Exception:
+        return None
+
+    entries = _load_entries()
+    if not entries:
+        return None
+
+    # Embeddings are normalized, so cosine similarity is a plain dot product;
+    # with a few hundred entries a flat scan is sub-millisecond
+    best_dist = _DISTANCE_THRESHOLD
+    best_output = None
+    for entry in entries:
+        if entry.get("config_key") != config_key:
+            continue
+        other = entry["embedding"]
+        if np is not None:
+            sim = float(np.dot(np.asarray(vec), np.asarray(other)))
+        else:
+            sim = sum(a * b for a, b in zip(vec, other))
+        dist = 1.0 - sim
+        if dist < best_dist:
+            best_dist = dist
+            best_output = entry["output"]
+    return best_output
+
+
+def semantic_store(signals, config_key: str, output: str) -> None:
+    """Insert an (embedding, output) pair, evicting the oldest entries."""
+    if not have_semantic_cache():
+        return
+    try:
+        vec = _embed(signals)
+    except Exception:
+        return
+    entries = _load_entries()
+    entries.append({"embedding": vec, "config_key": config_key, "output": output})
+    _save_entries(entries[-_MAX_ENTRIES:])